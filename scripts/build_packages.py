@@ -9,8 +9,52 @@ import os
 import sys
 import zipfile
 from pathlib import Path
+from typing import BinaryIO
 
 MODULES_DIR = Path("modules")
+# Cache and VCS directories that never belong in the archive
+SKIP_DIRS = frozenset(
+    {"__pycache__", ".pytest_cache", ".git", ".mypy_cache", ".ruff_cache"}
+)
+# Fastest DEFLATE level; the ratio loss on module source files is small
+COMPRESS_LEVEL = 1
+# Already-compressed formats that are stored as-is instead of deflated again
+STORED_EXTENSIONS = frozenset(
+    {
+        ".png",
+        ".jpg",
+        ".jpeg",
+        ".gif",
+        ".zip",
+        ".gz",
+        ".xz",
+        ".zst",
+        ".parquet",
+        ".pdf",
+        ".woff2",
+    }
+)
+
+
+class HashingWriter:
+    """
+    Write-only stream that computes a SHA256 hash of everything written to it.
+
+    The wrapper is deliberately not seekable, so zipfile writes the archive
+    strictly sequentially (using data descriptors instead of seeking back to
+    patch local headers) and the hash matches the bytes on disk.
+    """
+
+    def __init__(self, raw: BinaryIO):
+        self.raw = raw
+        self.sha256 = hashlib.sha256()
+
+    def write(self, data: bytes) -> int:
+        self.sha256.update(data)
+        return self.raw.write(data)
+
+    def flush(self) -> None:
+        self.raw.flush()
 
 
 def create_modules_zip(output_name: str | None = None) -> str:
@@ -42,37 +86,47 @@ def create_modules_zip(output_name: str | None = None) -> str:
     print(f"Creating zip archive: {output_path}")
     print(f"Source directory: {MODULES_DIR}")
 
+    file_count = 0
     try:
-        with zipfile.ZipFile(output_path, "w", zipfile.ZIP_DEFLATED) as zipf:
-            # Walk through the modules directory
-            for root, dirs, files in os.walk(MODULES_DIR):
-                # Skip __pycache__ and other common Python cache directories
-                dirs[:] = [
-                    d for d in dirs if d not in ["__pycache__", ".pytest_cache", ".git"]
-                ]
-
-                # Add files to zip
-                for file in files:
-                    file_path = Path(root) / file
-                    # Calculate relative path for the zip (relative to modules directory)
-                    arcname = file_path.relative_to(MODULES_DIR)
-
-                    print(f"  Adding: {arcname}")
-                    zipf.write(file_path, arcname)
+        with open(output_path, "wb") as raw:
+            writer = HashingWriter(raw)
+            # typeshed's writable protocol also asks for close(), which zipfile
+            # never calls on a file object it was handed
+            with zipfile.ZipFile(  # type: ignore[call-overload]
+                writer,
+                "w",
+                zipfile.ZIP_DEFLATED,
+                allowZip64=True,
+                compresslevel=COMPRESS_LEVEL,
+            ) as zipf:
+                # Walk through the modules directory
+                for root, dirs, files in os.walk(MODULES_DIR):
+                    # Skip __pycache__ and other common Python cache directories
+                    dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
+
+                    # Add files to zip
+                    for file in files:
+                        file_path = Path(root) / file
+                        # Calculate relative path for the zip (relative to modules directory)
+                        arcname = file_path.relative_to(MODULES_DIR)
+
+                        compress_type = (
+                            zipfile.ZIP_STORED
+                            if file_path.suffix.lower() in STORED_EXTENSIONS
+                            else zipfile.ZIP_DEFLATED
+                        )
+                        zipf.write(file_path, arcname, compress_type=compress_type)
+                        file_count += 1
 
         # Get file size
         file_size = output_path.stat().st_size
         file_size_mb = file_size / (1024 * 1024)
 
-        # Calculate SHA256 hash
-        sha256_hash = hashlib.sha256()
-        with open(output_path, "rb") as f:
-            # Read file in chunks to handle large files efficiently
-            for chunk in iter(lambda: f.read(4096), b""):
-                sha256_hash.update(chunk)
-        hash_digest = sha256_hash.hexdigest()
+        # SHA256 hash was computed while the archive was written
+        hash_digest = writer.sha256.hexdigest()
 
         print(f"\n✅ Successfully created: {output_path}")
+        print(f"📄 Files: {file_count:,}")
         print(f"📦 File size: {file_size_mb:.2f} MB ({file_size:,} bytes)")
         print(f"🔐 Hash: sha256:{hash_digest}")
         print(f"📁 Source: {MODULES_DIR}")
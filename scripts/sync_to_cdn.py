@@ -1,7 +1,12 @@
+import base64
 import json
+import logging
 import os
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+import google_crc32c
 from google.cloud import storage
 from google.oauth2 import service_account
 
@@ -10,6 +15,11 @@ BUCKET_NAME = "apps-cdn-bucket-cognitedata-production"
 LOCAL_DIR = "data"
 DEST_PREFIX = "toolkit"
 SOURCE_DIR = "data"
+# Matches the per-host connection pool of the client's requests session
+MAX_UPLOAD_WORKERS = 10
+CHECKSUM_CHUNK_SIZE = 1024 * 1024
+
+logger = logging.getLogger(__name__)
 
 
 def authenticate_with_service_account(credentials_json: str) -> storage.Client:
@@ -25,11 +35,32 @@ def authenticate_with_service_account(credentials_json: str) -> storage.Client:
     return storage.Client(credentials=credentials)
 
 
+def walk_files(root: str, prefix: str = "") -> Iterator[tuple[str, str]]:
+    # Yield (path, relative POSIX path) for every file below root, using the
+    # file type cached on each DirEntry instead of stat-ing every path again
+    with os.scandir(root) as entries:
+        for entry in entries:
+            relative = f"{prefix}{entry.name}"
+            if entry.is_dir(follow_symlinks=False):
+                yield from walk_files(entry.path, f"{relative}/")
+            elif entry.is_file():
+                yield entry.path, relative
+
+
+def local_crc32c(path: str) -> str:
+    # Base64-encoded CRC32C of a local file, in the format GCS reports for blobs
+    crc = 0
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(CHECKSUM_CHUNK_SIZE), b""):
+            crc = google_crc32c.extend(crc, chunk)
+    return base64.b64encode(crc.to_bytes(4, "big")).decode("ascii")
+
+
 def sync_local_to_gcs(local_dir: str, dest_prefix: str) -> None:
     local_path = Path(local_dir)
 
     if not local_path.is_dir():
-        print(f"Error: {local_dir} is not a valid directory.")
+        logger.error("%s is not a valid directory.", local_dir)
         return
 
     credentials_json = os.environ.get(SECRET_KEY)
@@ -40,19 +71,38 @@ def sync_local_to_gcs(local_dir: str, dest_prefix: str) -> None:
     client = authenticate_with_service_account(credentials_json)
     bucket = client.bucket(BUCKET_NAME)
 
+    # List the destination prefix once, with checksums, instead of checking
+    # each blob separately
+    existing = {
+        blob.name: blob.crc32c
+        for blob in client.list_blobs(
+            BUCKET_NAME,
+            prefix=f"{dest_prefix}/",
+            fields="items(name,crc32c),nextPageToken",
+        )
+    }
+
     # Traverse through all files in the local directory
-    for source in local_path.rglob("*"):
-        if source.is_file():  # Only process files
-            destination = Path(dest_prefix) / source.relative_to(local_path)
-            blob = bucket.blob(str(destination))
-            if blob.exists():
-                print(
-                    f"Skipping {source}, already exists in bucket as {destination!s}."
-                )
-                continue
-            print(f"Uploading {source} to {destination!s}...")
-            blob.upload_from_filename(str(source))
+    files = [
+        (source, f"{dest_prefix}/{relative}")
+        for source, relative in walk_files(local_dir)
+    ]
+
+    def _sync_one(file: tuple[str, str]) -> None:
+        source, destination = file
+        remote_crc32c = existing.get(destination)
+        if remote_crc32c is not None and remote_crc32c == local_crc32c(source):
+            logger.info("Skipping %s, unchanged in bucket as %s.", source, destination)
+            return
+        logger.info("Uploading %s to %s...", source, destination)
+        blob = bucket.blob(destination)
+        blob.upload_from_filename(source)
+
+    # Uploads are network-bound, so run them concurrently on a shared client
+    with ThreadPoolExecutor(max_workers=MAX_UPLOAD_WORKERS) as executor:
+        list(executor.map(_sync_one, files))
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     sync_local_to_gcs(LOCAL_DIR, DEST_PREFIX)
@@ -4,87 +4,207 @@ Checks structure and validates that all module paths exist.
 Assumes "modules" as the base folder where packages.toml is located.
 """
 
+import functools
+import os
+import posixpath
 import sys
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
 import tomllib
-from pydantic import BaseModel, Field, field_validator
 
 MODULES_DIR = Path("modules")
 PACKAGES_FILE = MODULES_DIR / "packages.toml"
 
 
-class Library(BaseModel):
+def _require_table(value: Any, name: str) -> dict[str, Any]:
+    """Ensure a value is a TOML table."""
+    if not isinstance(value, dict):
+        raise ValueError(f"{name}: Must be a table")
+    return value
+
+
+def _require_non_empty(data: dict[str, Any], key: str, name: str) -> str:
+    """Ensure a required field is a string with at least one character."""
+    value = data.get(key)
+    if not isinstance(value, str) or not value:
+        raise ValueError(f"{name}.{key}: Must be a non-empty string")
+    return value
+
+
+def _require_non_blank(data: dict[str, Any], key: str, name: str) -> str:
+    """Ensure a required field is a string that is not just whitespace."""
+    value = _require_non_empty(data, key, name)
+    if not value.strip():
+        raise ValueError(f"{name}.{key}: Must be a non-empty string")
+    return value
+
+
+# String spellings accepted for booleans, matching Pydantic's lax bool parsing
+_TRUE_STRINGS = frozenset({"1", "on", "t", "true", "y", "yes"})
+_FALSE_STRINGS = frozenset({"0", "off", "f", "false", "n", "no"})
+
+
+def _optional_bool(data: dict[str, Any], key: str, name: str, default: bool) -> bool:
+    """Ensure an optional field is a boolean, falling back to a default."""
+    value = data.get(key, default)
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, (int, float)) and value in (0, 1):
+        return bool(value)
+    if isinstance(value, str):
+        if value.lower() in _TRUE_STRINGS:
+            return True
+        if value.lower() in _FALSE_STRINGS:
+            return False
+    raise ValueError(f"{name}.{key}: Must be a boolean")
+
+
+@dataclass(slots=True, frozen=True)
+class Library:
     """Library header section of packages.toml."""
 
-    title: str = Field(min_length=1, description="Library title")
-    description: str = Field(min_length=1, description="Library description")
+    title: str
+    description: str
 
-    @field_validator("title", "description")
     @classmethod
-    def validate_non_empty_string(cls, v: str) -> str:
-        """Ensure strings are not just whitespace."""
-        if not v.strip():
-            raise ValueError("Must be a non-empty string")
-        return v
+    def from_dict(cls, value: Any, name: str = "library") -> "Library":
+        """Build the [library] section from parsed TOML."""
+        data = _require_table(value, name)
+        return cls(
+            title=_require_non_blank(data, "title", name),
+            description=_require_non_blank(data, "description", name),
+        )
 
 
-class Package(BaseModel):
+@dataclass(slots=True, frozen=True)
+class Package:
     """Individual package definition."""
 
-    title: str = Field(min_length=1, description="Package title")
-    id: str = Field(min_length=1, description="Package ID")
-    description: str = Field(min_length=1, description="Package description")
-    modules: list[str] = Field(min_length=1, description="List of module paths")
-    canCherryPick: bool = Field(
-        default=True, description="Whether modules can be cherry-picked"
-    )
+    title: str
+    id: str
+    description: str
+    modules: list[str]
+    canCherryPick: bool = True
 
-    @field_validator("title", "description", "id")
     @classmethod
-    def validate_non_empty_string(cls, v: str) -> str:
-        """Ensure strings are not just whitespace."""
-        if not v.strip():
-            raise ValueError("Must be a non-empty string")
-        return v
+    def from_dict(cls, value: Any, name: str) -> "Package":
+        """Build a package definition from parsed TOML."""
+        data = _require_table(value, name)
+        modules = data.get("modules")
+        if (
+            not isinstance(modules, list)
+            or not modules
+            or not all(isinstance(module, str) for module in modules)
+        ):
+            raise ValueError(f"{name}.modules: Must be a non-empty list of strings")
+        return cls(
+            title=_require_non_blank(data, "title", name),
+            id=_require_non_blank(data, "id", name),
+            description=_require_non_blank(data, "description", name),
+            modules=modules,
+            canCherryPick=_optional_bool(data, "canCherryPick", name, True),
+        )
 
 
-class Module(BaseModel):
+@dataclass(slots=True, frozen=True)
+class Module:
     """Module definition from module.toml."""
 
-    id: str = Field(min_length=1, description="Module ID")
-    package_id: str = Field(
-        min_length=1, description="Package ID this module belongs to"
-    )
-    title: str = Field(min_length=1, description="Module title")
-    is_selected_by_default: bool = Field(
-        default=True, description="Whether module is selected by default"
-    )
+    id: str
+    package_id: str
+    title: str
+    is_selected_by_default: bool = True
 
+    @classmethod
+    def from_dict(cls, value: Any, name: str = "module") -> "Module":
+        """Build the [module] section from parsed TOML."""
+        data = _require_table(value, name)
+        return cls(
+            id=_require_non_empty(data, "id", name),
+            package_id=_require_non_empty(data, "package_id", name),
+            title=_require_non_empty(data, "title", name),
+            is_selected_by_default=_optional_bool(
+                data, "is_selected_by_default", name, True
+            ),
+        )
 
-class ExtraResource(BaseModel):
+
+@dataclass(slots=True, frozen=True)
+class ExtraResource:
     """Extra resource definition from module.toml."""
 
-    location: str = Field(min_length=1, description="Relative path to extra resource")
+    location: str
+
+    @classmethod
+    def from_dict(cls, value: Any, name: str) -> "ExtraResource":
+        """Build an [[extra_resources]] entry from parsed TOML."""
+        data = _require_table(value, name)
+        return cls(location=_require_non_empty(data, "location", name))
 
 
-class ModuleToml(BaseModel):
+@dataclass(slots=True, frozen=True)
+class ModuleToml:
     """Full module.toml file structure."""
 
     module: Module
-    extra_resources: list[ExtraResource] = Field(
-        default_factory=list, description="Extra resources for the module"
-    )
+    extra_resources: list[ExtraResource] = field(default_factory=list)
+
+    @classmethod
+    def from_dict(cls, value: Any) -> "ModuleToml":
+        """Build a module.toml structure from parsed TOML."""
+        data = _require_table(value, "module.toml")
+        extra_resources = data.get("extra_resources", [])
+        if not isinstance(extra_resources, list):
+            raise ValueError("extra_resources: Must be a list of tables")
+        return cls(
+            module=Module.from_dict(data.get("module")),
+            extra_resources=[
+                ExtraResource.from_dict(resource, f"extra_resources[{i}]")
+                for i, resource in enumerate(extra_resources)
+            ],
+        )
 
 
-class PackagesToml(BaseModel):
+@dataclass(slots=True, frozen=True)
+class PackagesToml:
     """Full packages.toml file structure."""
 
     library: Library
-    packages: dict[str, Package] = Field(
-        min_length=1, description="Dictionary of packages"
-    )
+    packages: dict[str, Package]
+
+    @classmethod
+    def from_dict(cls, value: Any) -> "PackagesToml":
+        """Build a packages.toml structure from parsed TOML."""
+        data = _require_table(value, "packages.toml")
+        packages = _require_table(data.get("packages"), "packages")
+        if not packages:
+            raise ValueError("packages: Must contain at least one package")
+        return cls(
+            library=Library.from_dict(data.get("library")),
+            packages={
+                package_name: Package.from_dict(package, f"packages.{package_name}")
+                for package_name, package in packages.items()
+            },
+        )
+
+
+@functools.cache
+def load_module_toml(module_toml_path: Path) -> ModuleToml:
+    """
+    Load and validate a module.toml file.
+
+    Results are cached per path, so a module referenced by several packages
+    is only parsed once.
+
+    Raises:
+        tomllib.TOMLDecodeError: If the file is not valid TOML
+        ValueError: If the file does not match the ModuleToml structure
+    """
+    with open(module_toml_path, "rb") as f:
+        module_data = tomllib.load(f)
+    return ModuleToml.from_dict(module_data)
 
 
 class PackageValidator:
@@ -99,6 +219,31 @@ class PackageValidator:
         """
         self.base_path = base_path
         self.packages_file = base_path / "packages.toml"
+        # Index the module tree once so path checks don't stat each path.
+        # Keys are POSIX paths relative to base_path, e.g. "cdf_common/module.toml"
+        self.existing_paths: set[str] = set()
+        self.index_base_path()
+
+    def index_base_path(self) -> None:
+        """Collect every file and directory under base_path in a single walk."""
+        self.existing_paths.clear()
+        for root, dirs, files in os.walk(self.base_path):
+            rel_root = os.path.relpath(root, self.base_path)
+            prefix = "" if rel_root == "." else rel_root.replace(os.sep, "/") + "/"
+            self.existing_paths.update(prefix + name for name in dirs)
+            self.existing_paths.update(prefix + name for name in files)
+
+    def path_exists(self, location: str) -> bool:
+        """
+        Check whether a path relative to base_path exists.
+
+        Paths in the index are answered without a stat call. Anything else, such
+        as locations outside base_path or below a symlinked directory, falls
+        back to checking the filesystem.
+        """
+        if posixpath.normpath(location) in self.existing_paths:
+            return True
+        return (self.base_path / location).exists()
 
     def load_packages_toml(self) -> dict[str, Any]:
         """Load and parse packages.toml file."""
@@ -126,32 +271,27 @@ class PackageValidator:
             ValueError: If module.toml is invalid
         """
         full_path = self.base_path / module_path
-        if not full_path.exists():
+        if not self.path_exists(module_path):
             raise FileNotFoundError(
                 f"ERROR: Package '{package_name}' module path '{module_path}' "
                 f"does not exist at '{full_path}'"
             )
 
         module_toml_path = full_path / "module.toml"
-        if not module_toml_path.exists():
+        if not self.path_exists(posixpath.join(module_path, "module.toml")):
             raise FileNotFoundError(
                 f"ERROR: Package '{package_name}' module path '{module_path}' "
                 f"does not have a module.toml file and is not a valid module"
             )
 
-        # Load and validate module.toml
+        # Load and validate module.toml structure
         try:
-            with open(module_toml_path, "rb") as f:
-                module_data = tomllib.load(f)
+            module_toml = load_module_toml(module_toml_path)
         except tomllib.TOMLDecodeError as e:
             raise ValueError(
                 f"ERROR: Package '{package_name}' module '{module_path}' "
                 f"has invalid TOML in module.toml: {e}"
             ) from e
-
-        # Validate module.toml structure using Pydantic
-        try:
-            module_toml = ModuleToml.model_validate(module_data)
         except ValueError as e:
             raise ValueError(
                 f"ERROR: Package '{package_name}' module '{module_path}' "
@@ -160,8 +300,8 @@ class PackageValidator:
 
         # Validate extra resources exist
         for extra_resource in module_toml.extra_resources:
-            resource_path = self.base_path / extra_resource.location
-            if not resource_path.exists():
+            if not self.path_exists(extra_resource.location):
+                resource_path = self.base_path / extra_resource.location
                 raise FileNotFoundError(
                     f"ERROR: Package '{package_name}' module '{module_path}' "
                     f"refers to a non-existent file: {resource_path}"
@@ -201,9 +341,9 @@ class PackageValidator:
         # Load packages.toml
         data = self.load_packages_toml()
 
-        # Validate using Pydantic model
+        # Validate packages.toml structure
         try:
-            packages_toml = PackagesToml.model_validate(data)
+            packages_toml = PackagesToml.from_dict(data)
         except ValueError as e:
             raise ValueError(f"ERROR: Invalid packages.toml structure: {e}") from e
 